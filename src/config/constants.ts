@@ -11,6 +11,9 @@
 export const WEBSOCKET_PONG_TIMEOUT = 5000; // milliseconds
 export const WEBSOCKET_PING_INTERVAL = 30000; // milliseconds
 
+// Analysis Configuration
+export const DEFAULT_ANALYSIS_CONCURRENCY = 8; // concurrent Gemini requests
+
 // Validation Configuration
 export const VALIDATION_TIMEOUT = 5000; // milliseconds
 export const HIGH_LATENCY_THRESHOLD = 5000; // milliseconds
@@ -18,6 +21,7 @@ export const HIGH_QUALITY_SCORE_THRESHOLD = 80; // percentage
 
 // Network Configuration
 export const DEFAULT_HTTP_PORT = 4008;
+export const MAX_JSONRPC_BATCH_SIZE = 50; // entries per JSON-RPC batch request
 
 // Cache Configuration
 export const DEFAULT_CACHE_TTL_SECONDS = 1800; // 30 minutes
@@ -51,6 +55,9 @@ export default {
   WEBSOCKET_PONG_TIMEOUT,
   WEBSOCKET_PING_INTERVAL,
 
+  // Analysis
+  DEFAULT_ANALYSIS_CONCURRENCY,
+
   // Validation
   VALIDATION_TIMEOUT,
   HIGH_LATENCY_THRESHOLD,
@@ -58,6 +65,7 @@ export default {
 
   // Network
   DEFAULT_HTTP_PORT,
+  MAX_JSONRPC_BATCH_SIZE,
 
   // Cache
   DEFAULT_CACHE_TTL_SECONDS,
@@ -19,6 +19,8 @@ import { createOpenAIService } from './services/gemini_service.js';
 import { createAnalyzeCryptoSentimentTool } from './tools/analyze_crypto_sentiment.js';
 import { createGetMarketNewsTool } from './tools/get_market_news.js';
 import { createValidateNewsSourceTool } from './tools/validate_news_source.js';
+import { DEFAULT_ANALYSIS_CONCURRENCY } from './config/constants.js';
+import { nowIso } from './utils/time.js';
 
 // Environment configuration schema
 const EnvSchema = z.object({
@@ -31,6 +33,7 @@ const EnvSchema = z.object({
   GEMINI_MODEL: z.string().default('gemini-2.0-flash-exp'),
   GEMINI_MAX_OUTPUT_TOKENS: z.coerce.number().default(1000),
   GEMINI_TEMPERATURE: z.coerce.number().min(0).max(2).default(0.1),
+  ANALYSIS_CONCURRENCY: z.coerce.number().int().min(1).default(DEFAULT_ANALYSIS_CONCURRENCY),
   REDIS_URL: z.string().optional(),
   CACHE_TTL_SECONDS: z.coerce.number().default(300),
   ENABLE_CACHE: z.coerce.boolean().default(true),
@@ -247,7 +250,7 @@ export class HttpMCPServer {
 
     res.json({
       status: 'healthy',
-      timestamp: new Date().toISOString(),
+      timestamp: nowIso(),
       uptime: Math.floor(uptime / 1000),
       version: '2.1.0',
       memory: {
@@ -459,6 +462,7 @@ export class HttpMCPServer {
         model: this.config.GEMINI_MODEL,
         maxOutputTokens: this.config.GEMINI_MAX_OUTPUT_TOKENS,
         temperature: this.config.GEMINI_TEMPERATURE,
+        maxConcurrency: this.config.ANALYSIS_CONCURRENCY,
       },
       this.logger
     );
@@ -18,11 +18,12 @@ import process from 'process';
 import { z } from 'zod';
 import type { Logger, Tool as _MCPTool, OpenAIService, CacheService } from './types/index.js';
 import { getLogger } from './utils/logger.js';
-import { createCacheService } from './services/cache_service.js';
+import { createCacheService, RedisCacheService } from './services/cache_service.js';
 import { createOpenAIService } from './services/gemini_service.js';
 import { createAnalyzeCryptoSentimentTool } from './tools/analyze_crypto_sentiment.js';
 import { createGetMarketNewsTool } from './tools/get_market_news.js';
 import { createValidateNewsSourceTool } from './tools/validate_news_source.js';
+import { DEFAULT_ANALYSIS_CONCURRENCY } from './config/constants.js';
 
 // Environment configuration schema
 const EnvSchema = z.object({
@@ -32,6 +33,7 @@ const EnvSchema = z.object({
   GEMINI_MODEL: z.string().default('gemini-2.0-flash-exp'),
   GEMINI_MAX_OUTPUT_TOKENS: z.coerce.number().default(1000),
   GEMINI_TEMPERATURE: z.coerce.number().min(0).max(2).default(0.1),
+  ANALYSIS_CONCURRENCY: z.coerce.number().int().min(1).default(DEFAULT_ANALYSIS_CONCURRENCY),
   REDIS_URL: z.string().optional(),
   CACHE_TTL_SECONDS: z.coerce.number().default(300),
   ENABLE_CACHE: z.coerce.boolean().default(true),
@@ -46,7 +48,9 @@ export class MCPNewsServer {
   private logger: Logger;
   private config: z.infer<typeof EnvSchema>;
   private cache: CacheService | null = null;
+  private stopPromise: Promise<void> | null = null;
   private tools: Map<string, Tool> = new Map();
+  private toolsList: Tool[] | null = null;
 
   constructor() {
     // Load environment configuration
@@ -126,14 +130,15 @@ export class MCPNewsServer {
       async () => {
         this.logger.debug('Handling tools/list request');
 
-        const toolsList: Tool[] = Array.from(this.tools.values()).map(tool => ({
+        // Tools are registered once at startup, so the list is built once
+        this.toolsList ??= Array.from(this.tools.values()).map(tool => ({
           name: tool.name,
           description: tool.description,
           inputSchema: tool.inputSchema,
         }));
 
         return {
-          tools: toolsList,
+          tools: this.toolsList,
         };
       }
     );
@@ -156,11 +161,12 @@ export class MCPNewsServer {
         try {
           const result = await (tool.execute as (params: unknown) => Promise<unknown>)(args || {});
 
+          // Compact encoding: indentation only inflates the payload sent over stdio
           return {
             content: [
               {
                 type: 'text',
-                text: typeof result === 'string' ? result : JSON.stringify(result, null, 2),
+                text: typeof result === 'string' ? result : JSON.stringify(result),
               },
             ],
           };
@@ -197,6 +203,7 @@ export class MCPNewsServer {
         model: this.config.GEMINI_MODEL,
         maxOutputTokens: this.config.GEMINI_MAX_OUTPUT_TOKENS,
         temperature: this.config.GEMINI_TEMPERATURE,
+        maxConcurrency: this.config.ANALYSIS_CONCURRENCY,
       },
       this.logger
     );
@@ -360,6 +367,9 @@ export class MCPNewsServer {
       execute: validationTool.execute.bind(validationTool),
     });
 
+    // Rebuild the tools/list response on the next request
+    this.toolsList = null;
+
     this.logger.info('MCP tools initialized', {
       toolCount: this.tools.size,
       toolNames: Array.from(this.tools.keys()),
@@ -392,12 +402,27 @@ export class MCPNewsServer {
 
   /**
    * Stop the server gracefully
+   * Repeated calls (e.g. SIGINT followed by SIGTERM) share the first shutdown
    */
   async stop(): Promise<void> {
+    this.stopPromise ??= this.shutdown();
+    return this.stopPromise;
+  }
+
+  /**
+   * Close the MCP transport and release the cache connection
+   */
+  private async shutdown(): Promise<void> {
     this.logger.info('Stopping MCP News Server');
 
     try {
       await this.server.close();
+
+      // Release the Redis connection instead of leaving it to process exit
+      if (this.cache instanceof RedisCacheService) {
+        await this.cache.disconnect();
+      }
+
       this.logger.info('MCP News Server stopped successfully');
     } catch (error) {
       this.logger.error('Error stopping MCP server', error);
@@ -409,16 +434,14 @@ export class MCPNewsServer {
 if (import.meta.url === `file://${process.argv[1]}`) {
   const server = new MCPNewsServer();
 
-  // Setup graceful shutdown
-  process.on('SIGINT', async () => {
+  // Setup graceful shutdown; stop() runs only once even if both signals arrive
+  const shutdown = async (): Promise<void> => {
     await server.stop();
     process.exit(0);
-  });
+  };
 
-  process.on('SIGTERM', async () => {
-    await server.stop();
-    process.exit(0);
-  });
+  process.once('SIGINT', shutdown);
+  process.once('SIGTERM', shutdown);
 
   // Start the server
   server.start().catch((error) => {
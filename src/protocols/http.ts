@@ -23,6 +23,7 @@ import {
   MCPErrorException
 } from '../types/index.js';
 import { createRateLimitMiddleware } from '../services/rate_limiter.js';
+import { nowIso } from '../utils/time.js';
 
 interface HttpConfig {
   port: number;
@@ -318,7 +319,7 @@ export class HttpProtocolHandler implements ProtocolHandler {
 
     res.json({
       status: 'healthy',
-      timestamp: new Date().toISOString(),
+      timestamp: nowIso(),
       uptime: Math.floor(uptime / 1000),
       version: '3.0.0',
       protocols: {
@@ -456,7 +457,7 @@ export class HttpProtocolHandler implements ProtocolHandler {
         count: tools.length,
       },
       metadata: {
-        timestamp: new Date().toISOString(),
+        timestamp: nowIso(),
         protocol: 'http-rest',
       },
     });
@@ -483,7 +484,7 @@ export class HttpProtocolHandler implements ProtocolHandler {
         success: true,
         data: result,
         metadata: {
-          timestamp: new Date().toISOString(),
+          timestamp: nowIso(),
           toolName,
           protocol: 'http-rest',
         },
@@ -506,7 +507,7 @@ export class HttpProtocolHandler implements ProtocolHandler {
             details: error.details,
           },
           metadata: {
-            timestamp: new Date().toISOString(),
+            timestamp: nowIso(),
             protocol: 'http-rest',
           },
         });
@@ -519,7 +520,7 @@ export class HttpProtocolHandler implements ProtocolHandler {
             type: 'TOOL_EXECUTION_ERROR',
           },
           metadata: {
-            timestamp: new Date().toISOString(),
+            timestamp: nowIso(),
             protocol: 'http-rest',
           },
         });
@@ -23,6 +23,7 @@ import {
   HEARTBEAT_INTERVAL,
   CONNECTION_TIMEOUT
 } from '../config/constants.js';
+import { nowIso } from '../utils/time.js';
 
 interface SSEConfig {
   port: number;
@@ -325,7 +326,7 @@ export class SSEProtocolHandler extends EventEmitter implements ProtocolHandler
 
     res.json({
       status: 'healthy',
-      timestamp: new Date().toISOString(),
+      timestamp: nowIso(),
       uptime: Math.floor(uptime / 1000),
       version: '3.0.0',
       protocol: 'sse',
@@ -11,7 +11,8 @@ import type {
   MCPResponse,
   ToolHandler,
   ToolExecutionContext,
-  Logger
+  Logger,
+  MCPTool
 } from '../types/index.js';
 import {
   MCPRequestSchema,
@@ -26,6 +27,7 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
   private logger: Logger;
   private _isRunning = false;
   private tools = new Map<string, ToolHandler>();
+  private toolsListResult: { tools: MCPTool[] } | null = null;
   private inputBuffer = '';
 
   constructor(logger: Logger) {
@@ -71,6 +73,8 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
       process.stdin.removeAllListeners('data');
       process.stdin.removeAllListeners('end');
       process.stdin.removeAllListeners('error');
+      process.off('SIGINT', this.handleSignal);
+      process.off('SIGTERM', this.handleSignal);
 
       this._isRunning = false;
       this.logger.info('STDIO MCP protocol handler stopped');
@@ -99,6 +103,7 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
    */
   registerTool(name: string, handler: ToolHandler): void {
     this.tools.set(name, handler);
+    this.toolsListResult = null;
     this.logger.debug('Tool registered', { toolName: name });
   }
 
@@ -107,6 +112,7 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
    */
   unregisterTool(name: string): void {
     this.tools.delete(name);
+    this.toolsListResult = null;
     this.logger.debug('Tool unregistered', { toolName: name });
   }
 
@@ -139,19 +145,18 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
     });
 
     // Handle process signals for graceful shutdown
-    process.on('SIGINT', () => {
-      this.logger.info('Received SIGINT, shutting down gracefully');
-      this.stop();
-      process.exit(0);
-    });
-
-    process.on('SIGTERM', () => {
-      this.logger.info('Received SIGTERM, shutting down gracefully');
-      this.stop();
-      process.exit(0);
-    });
+    process.once('SIGINT', this.handleSignal);
+    process.once('SIGTERM', this.handleSignal);
   }
 
+  /**
+   * Exit on SIGINT/SIGTERM only after stop() has completed
+   */
+  private readonly handleSignal = (signal: NodeJS.Signals): void => {
+    this.logger.info(`Received ${signal}, shutting down gracefully`);
+    void this.stop().finally(() => process.exit(0));
+  };
+
   /**
    * Process the input buffer for complete JSON messages
    */
@@ -186,22 +191,14 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
         return;
       }
 
-      // Validate MCP request format
-      const validationResult = MCPRequestSchema.safeParse(parsed);
-      if (!validationResult.success) {
-        this.sendError(null, ErrorCodes.INVALID_REQUEST, 'Invalid MCP request format');
+      // JSON-RPC batch: an array of requests answered with an array of responses
+      if (Array.isArray(parsed)) {
+        await this.processBatch(parsed);
         return;
       }
 
-      const request = validationResult.data;
-      this.logger.debug('Received MCP request', {
-        method: request.method,
-        id: request.id,
-        hasParams: !!request.params
-      });
-
-      // Route the request
-      await this.routeRequest(request);
+      const response = await this.handleRequest(parsed);
+      this.sendResponse(response);
 
     } catch (error) {
       this.logger.error('Error processing STDIO message', {
@@ -211,30 +208,79 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
     }
   }
 
+  /**
+   * Process a JSON-RPC batch, executing its requests concurrently
+   */
+  private async processBatch(batch: unknown[]): Promise<void> {
+    if (batch.length === 0) {
+      this.sendError(null, ErrorCodes.INVALID_REQUEST, 'Empty batch request');
+      return;
+    }
+
+    this.logger.debug('Received MCP batch request', { size: batch.length });
+
+    // Notifications (entries without an id) must not be answered, so they are
+    // left out of the response array
+    const responses = await Promise.all(
+      batch
+        .filter(entry => !this.isNotification(entry))
+        .map(entry => this.handleRequest(entry))
+    );
+
+    // An all-notification batch gets no reply at all
+    if (responses.length > 0) {
+      this.sendBatchResponse(responses);
+    }
+  }
+
+  /**
+   * Check whether a batch entry is a JSON-RPC notification (an object without an id)
+   */
+  private isNotification(entry: unknown): boolean {
+    return typeof entry === 'object' && entry !== null && !Array.isArray(entry) && !('id' in entry);
+  }
+
+  /**
+   * Validate and route a single parsed MCP request
+   */
+  private async handleRequest(parsed: unknown): Promise<MCPResponse> {
+    // Validate MCP request format
+    const validationResult = MCPRequestSchema.safeParse(parsed);
+    if (!validationResult.success) {
+      return this.createErrorResponse(null, ErrorCodes.INVALID_REQUEST, 'Invalid MCP request format');
+    }
+
+    const request = validationResult.data;
+    this.logger.debug('Received MCP request', {
+      method: request.method,
+      id: request.id,
+      hasParams: !!request.params
+    });
+
+    // Route the request
+    return this.routeRequest(request);
+  }
+
   /**
    * Route MCP request to appropriate handler
    */
-  private async routeRequest(request: MCPRequest): Promise<void> {
+  private async routeRequest(request: MCPRequest): Promise<MCPResponse> {
     try {
       switch (request.method) {
         case 'initialize':
-          await this.handleInitialize(request);
-          break;
+          return await this.handleInitialize(request);
 
         case 'tools/list':
-          await this.handleToolsList(request);
-          break;
+          return await this.handleToolsList(request);
 
         case 'tools/call':
-          await this.handleToolCall(request);
-          break;
+          return await this.handleToolCall(request);
 
         case 'ping':
-          await this.handlePing(request);
-          break;
+          return await this.handlePing(request);
 
         default:
-          this.sendError(
+          return this.createErrorResponse(
             request.id,
             ErrorCodes.METHOD_NOT_FOUND,
             `Method not found: ${request.method}`
@@ -249,73 +295,61 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
       });
 
       if (error instanceof MCPErrorException) {
-        this.sendError(request.id, error.code, error.message, error.details);
-      } else {
-        this.sendError(
-          request.id,
-          ErrorCodes.INTERNAL_ERROR,
-          'Internal server error'
-        );
+        return this.createErrorResponse(request.id, error.code, error.message, error.details);
       }
+
+      return this.createErrorResponse(
+        request.id,
+        ErrorCodes.INTERNAL_ERROR,
+        'Internal server error'
+      );
     }
   }
 
   /**
    * Handle MCP initialize request
    */
-  private async handleInitialize(request: MCPRequest): Promise<void> {
+  private async handleInitialize(request: MCPRequest): Promise<MCPResponse> {
     this.logger.info('Handling initialize request', { id: request.id });
 
-    const response: MCPResponse = {
-      jsonrpc: '2.0',
-      id: request.id,
-      result: {
-        protocolVersion: '2024-11-05',
-        capabilities: {
-          tools: {
-            supportsProgress: false,
-            supportsParallelExecution: true,
-          },
-        },
-        serverInfo: {
-          name: 'mcp-news-v3',
-          version: '3.0.0',
-          description: 'Universal MCP Server for cryptocurrency news sentiment analysis',
+    return this.createSuccessResponse(request.id, {
+      protocolVersion: '2024-11-05',
+      capabilities: {
+        tools: {
+          supportsProgress: false,
+          supportsParallelExecution: true,
         },
       },
-    };
-
-    this.sendResponse(response);
+      serverInfo: {
+        name: 'mcp-news-v3',
+        version: '3.0.0',
+        description: 'Universal MCP Server for cryptocurrency news sentiment analysis',
+      },
+    });
   }
 
   /**
    * Handle tools/list request
    */
-  private async handleToolsList(request: MCPRequest): Promise<void> {
+  private async handleToolsList(request: MCPRequest): Promise<MCPResponse> {
     this.logger.debug('Handling tools/list request', { id: request.id });
 
-    const tools = Array.from(this.tools.values()).map(handler => handler.definition);
-
-    const response: MCPResponse = {
-      jsonrpc: '2.0',
-      id: request.id,
-      result: {
-        tools,
-      },
+    // Definitions only change on (un)registration, so the list is built once
+    this.toolsListResult ??= {
+      tools: Array.from(this.tools.values()).map(handler => handler.definition),
     };
 
-    this.sendResponse(response);
+    return this.createSuccessResponse(request.id, this.toolsListResult);
   }
 
   /**
    * Handle tools/call request
    */
-  private async handleToolCall(request: MCPRequest): Promise<void> {
+  private async handleToolCall(request: MCPRequest): Promise<MCPResponse> {
     const params = request.params as { name?: string; arguments?: unknown };
 
     if (!params || !params.name) {
-      this.sendError(request.id, ErrorCodes.INVALID_PARAMS, 'Tool name is required');
-      return;
+      return this.createErrorResponse(request.id, ErrorCodes.INVALID_PARAMS, 'Tool name is required');
     }
 
     const toolName = params.name;
@@ -329,12 +363,11 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
 
     const toolHandler = this.tools.get(toolName);
     if (!toolHandler) {
-      this.sendError(
+      return this.createErrorResponse(
         request.id,
         ErrorCodes.TOOL_NOT_FOUND,
         `Tool not found: ${toolName}`
       );
-      return;
     }
 
     try {
@@ -346,20 +379,15 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
 
       const result = await toolHandler.execute(toolArguments, context);
 
-      const response: MCPResponse = {
-        jsonrpc: '2.0',
-        id: request.id,
-        result: {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        },
-      };
-
-      this.sendResponse(response);
+      // Compact encoding: indentation only inflates the payload sent over stdio
+      return this.createSuccessResponse(request.id, {
+        content: [
+          {
+            type: 'text',
+            text: JSON.stringify(result),
+          },
+        ],
+      });
 
     } catch (error) {
       this.logger.error('Tool execution failed', {
@@ -369,33 +397,27 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
       });
 
       if (error instanceof MCPErrorException) {
-        this.sendError(request.id, error.code, error.message, error.details);
-      } else {
-        this.sendError(
-          request.id,
-          ErrorCodes.TOOL_EXECUTION_ERROR,
-          `Tool execution failed: ${error instanceof Error ? error.message : String(error)}`
-        );
+        return this.createErrorResponse(request.id, error.code, error.message, error.details);
       }
+
+      return this.createErrorResponse(
+        request.id,
+        ErrorCodes.TOOL_EXECUTION_ERROR,
+        `Tool execution failed: ${error instanceof Error ? error.message : String(error)}`
+      );
     }
   }
 
   /**
    * Handle ping request
    */
-  private async handlePing(request: MCPRequest): Promise<void> {
+  private async handlePing(request: MCPRequest): Promise<MCPResponse> {
     this.logger.trace('Handling ping request', { id: request.id });
 
-    const response: MCPResponse = {
-      jsonrpc: '2.0',
-      id: request.id,
-      result: {
-        pong: true,
-        timestamp: Date.now(),
-      },
-    };
-
-    this.sendResponse(response);
+    return this.createSuccessResponse(request.id, {
+      pong: true,
+      timestamp: Date.now(),
+    });
   }
 
   /**
@@ -420,6 +442,23 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
     }
   }
 
+  /**
+   * Send the responses of a batch request as a single JSON array
+   */
+  private sendBatchResponse(responses: MCPResponse[]): void {
+    try {
+      process.stdout.write(JSON.stringify(responses) + '\n');
+
+      this.logger.trace('Sent MCP batch response', { size: responses.length });
+
+    } catch (error) {
+      this.logger.error('Failed to send MCP batch response', {
+        size: responses.length,
+        error: error instanceof Error ? error.message : String(error)
+      });
+    }
+  }
+
   /**
    * Send MCP error response
    */
@@ -429,17 +468,35 @@ export class StdioProtocolHandler extends EventEmitter implements ProtocolHandle
     message: string,
     data?: unknown
   ): void {
-    const response: MCPResponse = {
+    this.sendResponse(this.createErrorResponse(id, code, message, data));
+  }
+
+  /**
+   * Create MCP error response
+   */
+  private createErrorResponse(
+    id: string | number | null,
+    code: number,
+    message: string,
+    data?: unknown
+  ): MCPResponse {
+    // Only include data when present, so the common case stays a single literal
+    if (data === undefined) {
+      return { jsonrpc: '2.0', id, error: { code, message } };
+    }
+
+    return { jsonrpc: '2.0', id, error: { code, message, data } };
+  }
+
+  /**
+   * Create MCP success response
+   */
+  private createSuccessResponse(id: string | number, result: unknown): MCPResponse {
+    return {
       jsonrpc: '2.0',
-      id: id || 0,
-      error: {
-        code,
-        message,
-        data,
-      },
+      id,
+      result,
     };
-
-    this.sendResponse(response);
   }
 
   /**
@@ -19,6 +19,8 @@ import { createOpenAIService } from './services/gemini_service.js';
 import { createAnalyzeCryptoSentimentTool } from './tools/analyze_crypto_sentiment.js';
 import { createGetMarketNewsTool } from './tools/get_market_news.js';
 import { createValidateNewsSourceTool } from './tools/validate_news_source.js';
+import { DEFAULT_ANALYSIS_CONCURRENCY, MAX_JSONRPC_BATCH_SIZE } from './config/constants.js';
+import { nowIso } from './utils/time.js';
 
 // Environment configuration
 const EnvSchema = z.object({
@@ -31,6 +33,7 @@ const EnvSchema = z.object({
   GEMINI_MODEL: z.string().default('gemini-2.0-flash-exp'),
   GEMINI_MAX_OUTPUT_TOKENS: z.coerce.number().default(1000),
   GEMINI_TEMPERATURE: z.coerce.number().min(0).max(2).default(0.1),
+  ANALYSIS_CONCURRENCY: z.coerce.number().int().min(1).default(DEFAULT_ANALYSIS_CONCURRENCY),
   REDIS_URL: z.string().optional(),
   CACHE_TTL_SECONDS: z.coerce.number().default(300),
   ENABLE_CACHE: z.coerce.boolean().default(true),
@@ -155,7 +158,7 @@ export class MCPNewsServer {
 
     res.json({
       status: 'healthy',
-      timestamp: new Date().toISOString(),
+      timestamp: nowIso(),
       uptime: Math.floor(uptime / 1000),
       version: '2.1.0',
       tools: { registered: this.tools.size, names: Array.from(this.tools.keys()) },
@@ -173,15 +176,62 @@ export class MCPNewsServer {
   }
 
   private async handleMcpRequest(req: Request, res: Response): Promise<void> {
-    try {
-      const validationResult = JsonRpcRequestSchema.safeParse(req.body);
-      if (!validationResult.success) {
+    // JSON-RPC batch: run the entries concurrently and answer with an array
+    if (Array.isArray(req.body)) {
+      if (req.body.length === 0) {
+        res.status(400).json(this.createJsonRpcError(
+          null, ErrorCodes.INVALID_REQUEST, 'Empty batch request'
+        ));
+        return;
+      }
+
+      // Bound the work a single POST can start; every entry may be a tools/call
+      if (req.body.length > MAX_JSONRPC_BATCH_SIZE) {
         res.status(400).json(this.createJsonRpcError(
-          null, ErrorCodes.INVALID_REQUEST, 'Invalid JSON-RPC 2.0 request format'
+          null, ErrorCodes.INVALID_REQUEST,
+          `Batch request exceeds ${MAX_JSONRPC_BATCH_SIZE} entries`
         ));
         return;
       }
 
+      // Notifications (entries without an id) are not answered
+      const requests = req.body.filter(entry => !this.isNotification(entry));
+      if (requests.length === 0) {
+        res.status(204).end();
+        return;
+      }
+
+      const results = await Promise.all(requests.map(entry => this.processJsonRpcRequest(entry)));
+      res.json(results.map(result => result.payload));
+      return;
+    }
+
+    const { status, payload } = await this.processJsonRpcRequest(req.body);
+    res.status(status).json(payload);
+  }
+
+  /**
+   * Check whether a batch entry is a JSON-RPC notification (an object without an id)
+   */
+  private isNotification(entry: unknown): boolean {
+    return typeof entry === 'object' && entry !== null && !Array.isArray(entry) && !('id' in entry);
+  }
+
+  /**
+   * Execute a single JSON-RPC request, returning its response and HTTP status
+   */
+  private async processJsonRpcRequest(body: unknown): Promise<{ status: number; payload: object }> {
+    try {
+      const validationResult = JsonRpcRequestSchema.safeParse(body);
+      if (!validationResult.success) {
+        return {
+          status: 400,
+          payload: this.createJsonRpcError(
+            null, ErrorCodes.INVALID_REQUEST, 'Invalid JSON-RPC 2.0 request format'
+          ),
+        };
+      }
+
       const { method, params, id } = validationResult.data;
 
       let result: unknown;
@@ -196,19 +246,24 @@ export class MCPNewsServer {
           result = await this.handleToolsCall(params);
           break;
         default:
-          res.status(400).json(this.createJsonRpcError(
-            id, ErrorCodes.METHOD_NOT_FOUND, `Unknown method: ${method}`
-          ));
-          return;
+          return {
+            status: 400,
+            payload: this.createJsonRpcError(
+              id, ErrorCodes.METHOD_NOT_FOUND, `Unknown method: ${method}`
+            ),
+          };
       }
 
-      res.json({ jsonrpc: '2.0', result, id });
+      return { status: 200, payload: this.createJsonRpcResult(id, result) };
     } catch (error) {
       this.logger.error('MCP request error', { error });
-      res.status(500).json(this.createJsonRpcError(
-        req.body?.id || null, ErrorCodes.INTERNAL_ERROR,
-        error instanceof Error ? error.message : 'Unknown error'
-      ));
+      return {
+        status: 500,
+        payload: this.createJsonRpcError(
+          (body as { id?: string | number | null } | null)?.id ?? null, ErrorCodes.INTERNAL_ERROR,
+          error instanceof Error ? error.message : 'Unknown error'
+        ),
+      };
     }
   }
 
@@ -251,6 +306,10 @@ export class MCPNewsServer {
     }
   }
 
+  private createJsonRpcResult(id: string | number | null, result: unknown): object {
+    return { jsonrpc: '2.0', result, id };
+  }
+
   private createJsonRpcError(id: string | number | null, code: number, message: string): object {
     return { jsonrpc: '2.0', error: { code, message }, id };
   }
@@ -267,6 +326,7 @@ export class MCPNewsServer {
       model: this.config.GEMINI_MODEL,
       maxOutputTokens: this.config.GEMINI_MAX_OUTPUT_TOKENS,
       temperature: this.config.GEMINI_TEMPERATURE,
+      maxConcurrency: this.config.ANALYSIS_CONCURRENCY,
       mockMode: this.config.MOCK_EXTERNAL_APIS || !this.config.GEMINI_API_KEY,
     }, this.logger);
 
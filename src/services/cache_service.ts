@@ -3,6 +3,7 @@
  * Automatically falls back to memory cache if Redis is unavailable
  */
 
+import { createHash } from 'crypto';
 import { createClient, RedisClientType } from 'redis';
 import type { CacheService, Logger } from '../types/index.js';
 
@@ -77,6 +78,21 @@ class RedisCacheService implements CacheService {
     }
   }
 
+  async mget<T>(keys: string[]): Promise<Array<T | null>> {
+    if (!this.connected || keys.length === 0) {
+      return keys.map(() => null);
+    }
+
+    try {
+      const values = await this.client.mGet(keys);
+      this.logger.debug('Cache mget', { count: keys.length });
+      return values.map(value => value === null ? null : JSON.parse(value) as T);
+    } catch (error) {
+      this.logger.error('Cache mget error', { count: keys.length, error });
+      return keys.map(() => null);
+    }
+  }
+
   async set<T>(key: string, value: T, ttlSeconds?: number): Promise<void> {
     if (!this.connected) {
       return;
@@ -97,6 +113,31 @@ class RedisCacheService implements CacheService {
     }
   }
 
+  async mset<T>(entries: Array<[string, T]>, ttlSeconds?: number): Promise<void> {
+    if (!this.connected || entries.length === 0) {
+      return;
+    }
+
+    try {
+      // Queue every write and flush them in a single round trip (no MULTI/EXEC)
+      const pipeline = this.client.multi();
+      for (const [key, value] of entries) {
+        const serialized = JSON.stringify(value);
+
+        if (ttlSeconds && ttlSeconds > 0) {
+          pipeline.setEx(key, ttlSeconds, serialized);
+        } else {
+          pipeline.set(key, serialized);
+        }
+      }
+      await pipeline.execAsPipeline();
+
+      this.logger.debug('Cache mset', { count: entries.length, ttl: ttlSeconds });
+    } catch (error) {
+      this.logger.error('Cache mset error', { count: entries.length, error });
+    }
+  }
+
   async delete(key: string): Promise<void> {
     if (!this.connected) {
       return;
@@ -165,6 +206,10 @@ class MemoryCacheService implements CacheService {
     return entry.value as T;
   }
 
+  async mget<T>(keys: string[]): Promise<Array<T | null>> {
+    return Promise.all(keys.map(key => this.get<T>(key)));
+  }
+
   async set<T>(key: string, value: T, ttlSeconds?: number): Promise<void> {
     const expires = ttlSeconds && ttlSeconds > 0
       ? Date.now() + (ttlSeconds * 1000)
@@ -174,6 +219,12 @@ class MemoryCacheService implements CacheService {
     this.logger.debug('Cache set', { key, ttl: ttlSeconds });
   }
 
+  async mset<T>(entries: Array<[string, T]>, ttlSeconds?: number): Promise<void> {
+    for (const [key, value] of entries) {
+      await this.set(key, value, ttlSeconds);
+    }
+  }
+
   async delete(key: string): Promise<void> {
     const deleted = this.cache.delete(key);
     if (deleted) {
@@ -239,16 +290,22 @@ export async function createCacheService(
  */
 export class CacheKeys {
   static sentiment(content: string, coins: string[]): string {
-    const hash = this.hash(content + coins.sort().join(','));
+    const hash = this.hash(content + '\0' + [...coins].sort().join(','));
     return `sentiment:${hash}`;
   }
 
   static news(query: string, sources?: string[], limit?: number): string {
-    const key = `${query}:${sources?.sort().join(',') || 'all'}:${limit || 10}`;
+    const sourceKey = sources?.length ? [...sources].sort().join(',') : 'all';
+    const key = `${query}:${sourceKey}:${limit || 10}`;
     const hash = this.hash(key);
     return `news:${hash}`;
   }
 
+  static newsSource(source: string, query: string, limit?: number): string {
+    const hash = this.hash(`${source}:${query}:${limit || 10}`);
+    return `news:source:${hash}`;
+  }
+
   static sourceValidation(url: string, type: string): string {
     const hash = this.hash(url + type);
     return `validation:${hash}`;
@@ -259,14 +316,9 @@ export class CacheKeys {
   }
 
   private static hash(input: string): string {
-    // Simple hash function for cache keys
-    let hash = 0;
-    for (let i = 0; i < input.length; i++) {
-      const char = input.charCodeAt(i);
-      hash = ((hash << 5) - hash) + char;
-      hash = hash & hash; // Convert to 32-bit integer
-    }
-    return Math.abs(hash).toString(36);
+    // 64-bit digest: stable across processes and restarts, and far less
+    // collision-prone than a 32-bit rolling hash
+    return createHash('sha256').update(input).digest('hex').slice(0, 16);
   }
 }
 
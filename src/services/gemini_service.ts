@@ -5,6 +5,8 @@
 
 import { GoogleGenerativeAI } from '@google/generative-ai';
 import type { Logger, ServiceResponse } from '../types/index.js';
+import { nowIso } from '../utils/time.js';
+import { DEFAULT_ANALYSIS_CONCURRENCY } from '../config/constants.js';
 
 interface GeminiConfig {
   apiKey?: string;
@@ -12,6 +14,7 @@ interface GeminiConfig {
   maxOutputTokens: number;
   temperature: number;
   mockMode?: boolean;
+  maxConcurrency?: number;
 }
 
 interface SentimentAnalysisRequest {
@@ -29,6 +32,56 @@ interface SentimentAnalysisResult {
   reasoning: string;
 }
 
+// Keywords used by the mock-mode sentiment analysis
+const POSITIVE_KEYWORDS = ['bullish', 'positive', 'growth', 'up', 'gain', 'rise', 'buy', 'strong'];
+const NEGATIVE_KEYWORDS = ['bearish', 'negative', 'drop', 'down', 'fall', 'sell', 'weak', 'crash'];
+
+// Prompt text that does not depend on the request, built once per depth
+const BASE_SYSTEM_PROMPT = `You are a cryptocurrency market sentiment analysis expert. Your task is to analyze news articles, social media posts, and other content to determine their potential impact on cryptocurrency markets.
+
+You must respond with a valid JSON object containing:
+- "impact": one of "Positive", "Negative", or "Neutral"
+- "confidence_score": a number between 0 and 100 representing your confidence in the analysis
+- "summary": a brief summary of the analysis (max 200 characters)
+- "affected_coins": an array of cryptocurrency symbols that are likely to be affected
+- "reasoning": explanation of your analysis
+
+Guidelines:
+- Be objective and data-driven in your analysis
+- Consider both immediate and potential long-term impacts
+- Factor in market context and current trends
+- Assign confidence scores based on clarity and significance of the content`;
+
+const SYSTEM_PROMPTS: Record<'basic' | 'comprehensive', string> = {
+  basic: BASE_SYSTEM_PROMPT + '\n\nFor basic analysis, focus on direct and obvious impacts with clear reasoning.',
+  comprehensive: BASE_SYSTEM_PROMPT + `
+
+For comprehensive analysis, also consider:
+- Technical analysis implications
+- Regulatory and compliance factors
+- Market microstructure effects
+- Cross-correlation with other assets
+- Sentiment momentum and sustainability
+- Risk factors and potential reversals
+
+Provide more detailed reasoning and lower confidence scores for ambiguous situations.`,
+};
+
+const DEPTH_INSTRUCTIONS: Record<'basic' | 'comprehensive', string> = {
+  basic: '\n\nProvide a concise analysis focusing on the direct market impact.',
+  comprehensive: `
+
+Consider the following factors in your comprehensive analysis:
+1. Market sentiment indicators and language tone
+2. Technical developments mentioned (upgrades, partnerships, regulations)
+3. Market timing and context (bull/bear market conditions)
+4. Source credibility and potential bias
+5. Volume of social engagement if applicable
+6. Historical patterns for similar news types
+
+Provide detailed reasoning for your assessment.`,
+};
+
 /**
  * Gemini service for cryptocurrency sentiment analysis
  */
@@ -38,9 +91,13 @@ export class GeminiService {
   private config: GeminiConfig;
   private logger: Logger;
   private mockMode: boolean;
+  private maxConcurrency: number;
+  private activeRequests = 0;
+  private slotWaiters: Array<() => void> = [];
 
   constructor(config: GeminiConfig, logger: Logger) {
     this.config = config;
+    this.maxConcurrency = Math.max(1, config.maxConcurrency ?? DEFAULT_ANALYSIS_CONCURRENCY);
     this.logger = logger.child({ component: 'GeminiService' });
     this.mockMode = config.mockMode || !config.apiKey;
 
@@ -64,6 +121,7 @@ export class GeminiService {
         model: config.model,
         maxOutputTokens: config.maxOutputTokens,
         temperature: config.temperature,
+        maxConcurrency: this.maxConcurrency,
       });
     }
   }
@@ -95,9 +153,16 @@ export class GeminiService {
 
       const prompt = this.buildSentimentPrompt(request);
 
-      const result = await this.model.generateContent(prompt);
-      const response = await result.response;
-      const responseText = response.text();
+      // Cap in-flight Gemini calls so bursts queue here instead of at the API
+      let responseText: string;
+      await this.acquireSlot();
+      try {
+        const result = await this.model.generateContent(prompt);
+        const response = await result.response;
+        responseText = response.text();
+      } finally {
+        this.releaseSlot();
+      }
 
       if (!responseText) {
         throw new Error('No response from Gemini');
@@ -116,7 +181,7 @@ export class GeminiService {
         success: true,
         data: analysisResult,
         metadata: {
-          timestamp: new Date().toISOString(),
+          timestamp: nowIso(),
           responseTimeMs: responseTime,
         },
       };
@@ -131,13 +196,37 @@ export class GeminiService {
         success: false,
         error: error instanceof Error ? error.message : 'Unknown error',
         metadata: {
-          timestamp: new Date().toISOString(),
+          timestamp: nowIso(),
           responseTimeMs: responseTime,
         },
       };
     }
   }
 
+  /**
+   * Wait until fewer than maxConcurrency Gemini requests are in flight
+   */
+  private async acquireSlot(): Promise<void> {
+    if (this.activeRequests < this.maxConcurrency) {
+      this.activeRequests++;
+      return;
+    }
+
+    await new Promise<void>(resolve => this.slotWaiters.push(resolve));
+  }
+
+  /**
+   * Release a request slot, handing it directly to the next waiter if any
+   */
+  private releaseSlot(): void {
+    const next = this.slotWaiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.activeRequests--;
+    }
+  }
+
   /**
    * Generate mock sentiment analysis for testing/demo purposes
    */
@@ -148,12 +237,9 @@ export class GeminiService {
     const { content, coins } = request;
 
     // Simple keyword-based mock analysis
-    const positiveKeywords = ['bullish', 'positive', 'growth', 'up', 'gain', 'rise', 'buy', 'strong'];
-    const negativeKeywords = ['bearish', 'negative', 'drop', 'down', 'fall', 'sell', 'weak', 'crash'];
-
     const contentLower = content.toLowerCase();
-    const positiveCount = positiveKeywords.filter(word => contentLower.includes(word)).length;
-    const negativeCount = negativeKeywords.filter(word => contentLower.includes(word)).length;
+    const positiveCount = POSITIVE_KEYWORDS.filter(word => contentLower.includes(word)).length;
+    const negativeCount = NEGATIVE_KEYWORDS.filter(word => contentLower.includes(word)).length;
 
     let impact: 'Positive' | 'Negative' | 'Neutral';
     let confidence: number;
@@ -187,7 +273,7 @@ export class GeminiService {
         reasoning: `Mock analysis based on keyword detection (${positiveCount} positive, ${negativeCount} negative keywords found)`,
       },
       metadata: {
-        timestamp: new Date().toISOString(),
+        timestamp: nowIso(),
         responseTimeMs: responseTime,
       },
     };
@@ -210,7 +296,7 @@ export class GeminiService {
           model: this.config.model + ' (mock)',
         },
         metadata: {
-          timestamp: new Date().toISOString(),
+          timestamp: nowIso(),
           responseTimeMs: responseTime,
         },
       };
@@ -239,7 +325,7 @@ export class GeminiService {
           model: this.config.model,
         },
         metadata: {
-          timestamp: new Date().toISOString(),
+          timestamp: nowIso(),
           responseTimeMs: responseTime,
         },
       };
@@ -254,7 +340,7 @@ export class GeminiService {
         success: false,
         error: error instanceof Error ? error.message : 'Connection test failed',
         metadata: {
-          timestamp: new Date().toISOString(),
+          timestamp: nowIso(),
           responseTimeMs: responseTime,
         },
       };
@@ -267,7 +353,6 @@ export class GeminiService {
   private buildSentimentPrompt(request: SentimentAnalysisRequest): string {
     const { content, source, coins, analysisDepth } = request;
 
-    const systemPrompt = this.getSystemPrompt(analysisDepth);
     const basePrompt = `
 Analyze the sentiment of this cryptocurrency-related content:
 
@@ -279,59 +364,7 @@ Analyze the sentiment of this cryptocurrency-related content:
 Please analyze this content and determine its potential impact on the specified cryptocurrencies.
     `.trim();
 
-    const fullPrompt = systemPrompt + '\n\n' + basePrompt;
-
-    if (analysisDepth === 'comprehensive') {
-      return fullPrompt + `
-
-Consider the following factors in your comprehensive analysis:
-1. Market sentiment indicators and language tone
-2. Technical developments mentioned (upgrades, partnerships, regulations)
-3. Market timing and context (bull/bear market conditions)
-4. Source credibility and potential bias
-5. Volume of social engagement if applicable
-6. Historical patterns for similar news types
-
-Provide detailed reasoning for your assessment.`;
-    }
-
-    return fullPrompt + '\n\nProvide a concise analysis focusing on the direct market impact.';
-  }
-
-  /**
-   * Get system prompt based on analysis depth
-   */
-  private getSystemPrompt(depth: 'basic' | 'comprehensive'): string {
-    const basePrompt = `You are a cryptocurrency market sentiment analysis expert. Your task is to analyze news articles, social media posts, and other content to determine their potential impact on cryptocurrency markets.
-
-You must respond with a valid JSON object containing:
-- "impact": one of "Positive", "Negative", or "Neutral"
-- "confidence_score": a number between 0 and 100 representing your confidence in the analysis
-- "summary": a brief summary of the analysis (max 200 characters)
-- "affected_coins": an array of cryptocurrency symbols that are likely to be affected
-- "reasoning": explanation of your analysis
-
-Guidelines:
-- Be objective and data-driven in your analysis
-- Consider both immediate and potential long-term impacts
-- Factor in market context and current trends
-- Assign confidence scores based on clarity and significance of the content`;
-
-    if (depth === 'comprehensive') {
-      return basePrompt + `
-
-For comprehensive analysis, also consider:
-- Technical analysis implications
-- Regulatory and compliance factors
-- Market microstructure effects
-- Cross-correlation with other assets
-- Sentiment momentum and sustainability
-- Risk factors and potential reversals
-
-Provide more detailed reasoning and lower confidence scores for ambiguous situations.`;
-    }
-
-    return basePrompt + '\n\nFor basic analysis, focus on direct and obvious impacts with clear reasoning.';
+    return SYSTEM_PROMPTS[analysisDepth] + '\n\n' + basePrompt + DEPTH_INSTRUCTIONS[analysisDepth];
   }
 
   /**
@@ -342,11 +375,14 @@ Provide more detailed reasoning and lower confidence scores for ambiguous situat
       // Clean up the response text to extract JSON
       let jsonText = responseText.trim();
 
-      // Remove markdown code blocks if present
-      if (jsonText.startsWith('```json')) {
-        jsonText = jsonText.replace(/^```json\s*/, '').replace(/\s*```$/, '');
-      } else if (jsonText.startsWith('```')) {
-        jsonText = jsonText.replace(/^```\s*/, '').replace(/\s*```$/, '');
+      // Remove markdown code blocks if present; plain prefix/suffix checks
+      // avoid scanning the whole response with an anchored-at-end regex
+      if (jsonText.startsWith('```')) {
+        jsonText = jsonText.slice(jsonText.startsWith('```json') ? 7 : 3);
+        if (jsonText.endsWith('```')) {
+          jsonText = jsonText.slice(0, -3);
+        }
+        jsonText = jsonText.trim();
       }
 
       const parsed = JSON.parse(jsonText);
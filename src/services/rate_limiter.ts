@@ -44,12 +44,12 @@ export class SlidingWindowRateLimiter implements RateLimiter {
       const requestTimestamps = await this.cache.get<number[]>(cacheKey) || [];
 
       // Filter out old requests outside the current window
-      const validRequests = requestTimestamps.filter(timestamp => timestamp > windowStart);
+      const { validRequests, oldest } = this.scanWindow(requestTimestamps, windowStart);
 
       // Check if limit exceeded
       const isBlocked = validRequests.length >= this.maxRequests;
       const resetTimeMs = validRequests.length > 0
-        ? Math.min(...validRequests) + this.windowMs
+        ? oldest + this.windowMs
         : now + this.windowMs;
 
       // Add current request if not blocked
@@ -89,6 +89,28 @@ export class SlidingWindowRateLimiter implements RateLimiter {
     }
   }
 
+  /**
+   * Keep timestamps inside the window and find the oldest one in a single pass
+   */
+  private scanWindow(
+    timestamps: number[],
+    windowStart: number
+  ): { validRequests: number[]; oldest: number } {
+    const validRequests: number[] = [];
+    let oldest = Infinity;
+
+    for (const timestamp of timestamps) {
+      if (timestamp > windowStart) {
+        validRequests.push(timestamp);
+        if (timestamp < oldest) {
+          oldest = timestamp;
+        }
+      }
+    }
+
+    return { validRequests, oldest };
+  }
+
   async resetLimit(identifier: string): Promise<void> {
     const cacheKey = CacheKeys.rateLimit(identifier);
 
@@ -110,11 +132,11 @@ export class SlidingWindowRateLimiter implements RateLimiter {
 
     try {
       const requestTimestamps = await this.cache.get<number[]>(cacheKey) || [];
-      const validRequests = requestTimestamps.filter(timestamp => timestamp > windowStart);
+      const { validRequests, oldest } = this.scanWindow(requestTimestamps, windowStart);
 
       const isBlocked = validRequests.length >= this.maxRequests;
       const resetTimeMs = validRequests.length > 0
-        ? Math.min(...validRequests) + this.windowMs
+        ? oldest + this.windowMs
         : now + this.windowMs;
 
       return {
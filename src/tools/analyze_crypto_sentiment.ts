@@ -3,7 +3,6 @@
  * Analyzes cryptocurrency news sentiment using AI and caching
  */
 
-import { z } from 'zod';
 import type {
   AnalyzeCryptoSentimentParams,
   AnalyzeCryptoSentimentResponse,
@@ -18,6 +17,7 @@ import {
 } from '../types/index.js';
 import { OpenAIService } from '../services/gemini_service.js';
 import { CacheKeys } from '../services/cache_service.js';
+import { nowIso } from '../utils/time.js';
 
 /**
  * Tool implementation for cryptocurrency sentiment analysis
@@ -27,6 +27,7 @@ export class AnalyzeCryptoSentimentTool {
   private cache: CacheService;
   private logger: Logger;
   private cacheTtlSeconds: number;
+  private inFlight = new Map<string, Promise<AnalyzeCryptoSentimentResponse>>();
 
   constructor(
     openaiService: OpenAIService,
@@ -117,48 +118,27 @@ export class AnalyzeCryptoSentimentTool {
         return cachedResult;
       }
 
-      // Perform sentiment analysis using OpenAI
-      const analysisResult = await this.openaiService.analyzeSentiment({
-        content: validatedParams.content,
-        source: validatedParams.source,
-        coins: validatedParams.coins,
-        analysisDepth: validatedParams.analysis_depth,
-      });
-
-      if (!analysisResult.success || !analysisResult.data) {
-        throw new Error(analysisResult.error || 'Sentiment analysis failed');
-      }
-
-      // Build response
-      const response: AnalyzeCryptoSentimentResponse = {
-        impact: analysisResult.data.impact,
-        confidence_score: analysisResult.data.confidence_score,
-        summary: analysisResult.data.summary,
-        affected_coins: analysisResult.data.affected_coins,
-        metadata: {
-          timestamp: new Date().toISOString(),
-          source: validatedParams.source,
-        },
-      };
-
-      // Validate response structure
-      const validatedResponse = AnalyzeCryptoSentimentResponseSchema.parse(response);
-
-      // Cache the result (don't fail if caching fails)
-      try {
-        await this.cache.set(cacheKey, validatedResponse, this.cacheTtlSeconds);
-      } catch (cacheError) {
-        this.logger.warn('Failed to cache sentiment analysis result', {
+      // Identical analyses that are already running (e.g. duplicate items in a
+      // JSON-RPC batch) share one analyzer call instead of each missing the cache
+      let analysis = this.inFlight.get(cacheKey);
+      if (analysis) {
+        this.logger.debug('Joining in-flight sentiment analysis', {
           requestId: context?.requestId,
-          error: cacheError instanceof Error ? cacheError.message : String(cacheError),
+          cacheKey,
         });
+      } else {
+        analysis = this.runAnalysis(validatedParams, cacheKey, context)
+          .finally(() => this.inFlight.delete(cacheKey));
+        this.inFlight.set(cacheKey, analysis);
       }
 
+      const validatedResponse = await analysis;
+
       const executionTime = Date.now() - startTime;
       this.logger.info('Sentiment analysis completed', {
         requestId: context?.requestId,
-        impact: response.impact,
-        confidence: response.confidence_score,
+        impact: validatedResponse.impact,
+        confidence: validatedResponse.confidence_score,
         executionTimeMs: executionTime,
         cached: false,
       });
@@ -180,7 +160,7 @@ export class AnalyzeCryptoSentimentTool {
         summary: 'Analysis failed due to an error',
         affected_coins: [],
         metadata: {
-          timestamp: new Date().toISOString(),
+          timestamp: nowIso(),
           source: 'error',
         },
       };
@@ -189,21 +169,66 @@ export class AnalyzeCryptoSentimentTool {
     }
   }
 
+  /**
+   * Run the analyzer and cache its validated response
+   */
+  private async runAnalysis(
+    validatedParams: AnalyzeCryptoSentimentParams,
+    cacheKey: string,
+    context: ToolExecutionContext
+  ): Promise<AnalyzeCryptoSentimentResponse> {
+    // Perform sentiment analysis using OpenAI
+    const analysisResult = await this.openaiService.analyzeSentiment({
+      content: validatedParams.content,
+      source: validatedParams.source,
+      coins: validatedParams.coins,
+      analysisDepth: validatedParams.analysis_depth,
+    });
+
+    if (!analysisResult.success || !analysisResult.data) {
+      throw new Error(analysisResult.error || 'Sentiment analysis failed');
+    }
+
+    // Build response
+    const response: AnalyzeCryptoSentimentResponse = {
+      impact: analysisResult.data.impact,
+      confidence_score: analysisResult.data.confidence_score,
+      summary: analysisResult.data.summary,
+      affected_coins: analysisResult.data.affected_coins,
+      metadata: {
+        timestamp: nowIso(),
+        source: validatedParams.source,
+      },
+    };
+
+    // Validate response structure
+    const validatedResponse = AnalyzeCryptoSentimentResponseSchema.parse(response);
+
+    // Cache the result (don't fail if caching fails)
+    try {
+      await this.cache.set(cacheKey, validatedResponse, this.cacheTtlSeconds);
+    } catch (cacheError) {
+      this.logger.warn('Failed to cache sentiment analysis result', {
+        requestId: context?.requestId,
+        error: cacheError instanceof Error ? cacheError.message : String(cacheError),
+      });
+    }
+
+    return validatedResponse;
+  }
+
   /**
    * Validate input parameters using Zod schema
    */
   private validateParams(params: unknown): AnalyzeCryptoSentimentParams {
-    try {
-      return AnalyzeCryptoSentimentParamsSchema.parse(params);
-    } catch (error) {
-      if (error instanceof z.ZodError) {
-        const issues = error.issues.map(issue =>
-          `${issue.path.join('.')}: ${issue.message}`
-        ).join(', ');
-        throw new Error(`Invalid parameters: ${issues}`);
-      }
-      throw new Error('Parameter validation failed');
+    const result = AnalyzeCryptoSentimentParamsSchema.safeParse(params);
+    if (!result.success) {
+      const issues = result.error.issues.map(issue =>
+        `${issue.path.join('.')}: ${issue.message}`
+      ).join(', ');
+      throw new Error(`Invalid parameters: ${issues}`);
     }
+    return result.data;
   }
 
 
@@ -230,7 +255,7 @@ export class AnalyzeCryptoSentimentTool {
         details: {
           openai: openaiHealth.status,
           cache: cacheConnected ? 'connected' : 'disconnected',
-          lastHealthCheck: new Date().toISOString(),
+          lastHealthCheck: nowIso(),
         },
       };
     } catch (error) {
@@ -238,7 +263,7 @@ export class AnalyzeCryptoSentimentTool {
         status: 'unhealthy',
         details: {
           error: error instanceof Error ? error.message : String(error),
-          lastHealthCheck: new Date().toISOString(),
+          lastHealthCheck: nowIso(),
         },
       };
     }
@@ -3,7 +3,6 @@
  * Fetches recent cryptocurrency news from multiple sources
  */
 
-import { z } from 'zod';
 import type {
   GetMarketNewsParams,
   GetMarketNewsResponse,
@@ -19,6 +18,7 @@ import {
 import { CacheKeys } from '../services/cache_service.js';
 import { shouldUseMockMode, getMockModeWarning } from '../config/environment.js';
 import { NEWS_CACHE_TTL_SECONDS } from '../config/constants.js';
+import { nowIso } from '../utils/time.js';
 
 interface NewsSource {
   name: string;
@@ -225,17 +225,14 @@ export class GetMarketNewsTool {
    * Validate input parameters using Zod schema
    */
   private validateParams(params: unknown): GetMarketNewsParams {
-    try {
-      return GetMarketNewsParamsSchema.parse(params);
-    } catch (error) {
-      if (error instanceof z.ZodError) {
-        const issues = error.issues.map(issue =>
-          `${issue.path.join('.')}: ${issue.message}`
-        ).join(', ');
-        throw new Error(`Invalid parameters: ${issues}`);
-      }
-      throw new Error('Parameter validation failed');
+    const result = GetMarketNewsParamsSchema.safeParse(params);
+    if (!result.success) {
+      const issues = result.error.issues.map(issue =>
+        `${issue.path.join('.')}: ${issue.message}`
+      ).join(', ');
+      throw new Error(`Invalid parameters: ${issues}`);
     }
+    return result.data;
   }
 
   /**
@@ -297,7 +294,19 @@ export class GetMarketNewsTool {
       return [];
     }
 
-    const fetchPromises = sourcesToUse.map(async (sourceKey) => {
+    // Look up every source's cached results in one round trip
+    const sourceCacheKeys = sourcesToUse.map(sourceKey =>
+      CacheKeys.newsSource(sourceKey, params.query, params.limit)
+    );
+    const cachedResults = await this.getCachedSourceResults(sourceCacheKeys);
+    const freshResults: Array<[string, NewsArticle[]]> = [];
+
+    const fetchPromises = sourcesToUse.map(async (sourceKey, index) => {
+      const cached = cachedResults[index];
+      if (cached) {
+        return cached;
+      }
+
       const source = this.newsSources.get(sourceKey);
       if (!source) {
         this.logger.warn('Unknown news source requested', { source: sourceKey });
@@ -305,7 +314,11 @@ export class GetMarketNewsTool {
       }
 
       try {
-        return await this.fetchFromSource(source, params.query, params.limit);
+        const articles = await this.fetchFromSource(source, params.query, params.limit);
+        if (articles.length > 0) {
+          freshResults.push([sourceCacheKeys[index]!, articles]);
+        }
+        return articles;
       } catch (error) {
         this.logger.error('Failed to fetch from source', {
           source: sourceKey,
@@ -327,10 +340,37 @@ export class GetMarketNewsTool {
       }
     });
 
-    // Sort by published date (most recent first)
-    return allResults.sort((a, b) =>
-      new Date(b.published_at).getTime() - new Date(a.published_at).getTime()
-    );
+    // Write back freshly fetched sources in a single flush (don't fail if caching fails)
+    if (freshResults.length > 0) {
+      try {
+        await this.cache.mset(freshResults, this.cacheTtlSeconds);
+      } catch (cacheError) {
+        this.logger.warn('Failed to cache source results', {
+          error: cacheError instanceof Error ? cacheError.message : String(cacheError),
+        });
+      }
+    }
+
+    // Sort by published date (most recent first), parsing each date once
+    // instead of twice per comparison
+    return allResults
+      .map(article => ({ article, publishedMs: Date.parse(article.published_at) }))
+      .sort((a, b) => b.publishedMs - a.publishedMs)
+      .map(entry => entry.article);
+  }
+
+  /**
+   * Get cached per-source results, treating a cache failure as all misses
+   */
+  private async getCachedSourceResults(keys: string[]): Promise<Array<NewsArticle[] | null>> {
+    try {
+      return await this.cache.mget<NewsArticle[]>(keys);
+    } catch (error) {
+      this.logger.warn('Failed to read cached source results', {
+        error: error instanceof Error ? error.message : String(error),
+      });
+      return keys.map(() => null);
+    }
   }
 
   /**
@@ -472,7 +512,7 @@ export class GetMarketNewsTool {
           cache: cacheConnected ? 'connected' : 'disconnected',
           sourcesConfigured,
           mockMode: this.mockMode,
-          lastHealthCheck: new Date().toISOString(),
+          lastHealthCheck: nowIso(),
         },
       };
     } catch (error) {
@@ -480,7 +520,7 @@ export class GetMarketNewsTool {
         status: 'unhealthy',
         details: {
           error: error instanceof Error ? error.message : String(error),
-          lastHealthCheck: new Date().toISOString(),
+          lastHealthCheck: nowIso(),
         },
       };
     }
@@ -18,7 +18,8 @@ export const MCPRequestSchema = z.object({
 
 export const MCPResponseSchema = z.object({
   jsonrpc: z.literal('2.0'),
-  id: z.union([z.string(), z.number()]),
+  // null when the request id could not be determined (JSON-RPC 2.0, section 5)
+  id: z.union([z.string(), z.number(), z.null()]),
   result: z.unknown().optional(),
   error: z.object({
     code: z.number(),
@@ -44,7 +45,9 @@ export type MCPError = z.infer<typeof MCPErrorSchema>;
 
 // Tool 1: analyze_crypto_sentiment
 export const AnalyzeCryptoSentimentParamsSchema = z.object({
-  content: z.string().min(10, 'Content must be at least 10 characters'),
+  content: z.string()
+    .min(10, 'Content must be at least 10 characters')
+    .max(10000, 'Content must be at most 10000 characters'),
   source: z.string().min(1, 'Source is required'),
   coins: z.array(z.string().min(1)).min(1, 'At least one coin is required'),
   analysis_depth: z.enum(['basic', 'comprehensive']).default('basic'),
@@ -205,7 +208,9 @@ export type ServiceResponse<T = unknown> = {
 
 export interface CacheService {
   get<T>(key: string): Promise<T | null>;
+  mget<T>(keys: string[]): Promise<Array<T | null>>;
   set<T>(key: string, value: T, ttlSeconds?: number): Promise<void>;
+  mset<T>(entries: Array<[string, T]>, ttlSeconds?: number): Promise<void>;
   delete(key: string): Promise<void>;
   clear(): Promise<void>;
   isConnected(): boolean;
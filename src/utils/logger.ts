@@ -1,6 +1,7 @@
 /**
  * Structured logger using Pino for high-performance logging
  * Supports both development (pretty) and production (JSON) formats
+ * Disabled levels return before any log payload is built
  */
 
 import pino from 'pino';
@@ -41,6 +42,9 @@ class LoggerService implements Logger {
   }
 
   trace(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('trace')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.trace({ extra: args }, message);
     } else {
@@ -49,6 +53,9 @@ class LoggerService implements Logger {
   }
 
   debug(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('debug')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.debug({ extra: args }, message);
     } else {
@@ -57,6 +64,9 @@ class LoggerService implements Logger {
   }
 
   info(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('info')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.info({ extra: args }, message);
     } else {
@@ -65,6 +75,9 @@ class LoggerService implements Logger {
   }
 
   warn(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('warn')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.warn({ extra: args }, message);
     } else {
@@ -73,6 +86,9 @@ class LoggerService implements Logger {
   }
 
   error(message: string | Error, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('error')) {
+      return;
+    }
     if (message instanceof Error) {
       this.pinoLogger.error({
         error: {
@@ -157,6 +173,9 @@ class ChildLogger implements Logger {
   constructor(private pinoLogger: PinoLogger) {}
 
   trace(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('trace')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.trace({ extra: args }, message);
     } else {
@@ -165,6 +184,9 @@ class ChildLogger implements Logger {
   }
 
   debug(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('debug')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.debug({ extra: args }, message);
     } else {
@@ -173,6 +195,9 @@ class ChildLogger implements Logger {
   }
 
   info(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('info')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.info({ extra: args }, message);
     } else {
@@ -181,6 +206,9 @@ class ChildLogger implements Logger {
   }
 
   warn(message: string, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('warn')) {
+      return;
+    }
     if (args.length > 0) {
       this.pinoLogger.warn({ extra: args }, message);
     } else {
@@ -189,6 +217,9 @@ class ChildLogger implements Logger {
   }
 
   error(message: string | Error, ...args: unknown[]): void {
+    if (!this.pinoLogger.isLevelEnabled('error')) {
+      return;
+    }
     if (message instanceof Error) {
       this.pinoLogger.error({
         error: {
@@ -71,11 +71,10 @@ export function getMockNews(params: GetMarketNewsParams): NewsArticle[] {
   if (params.sources?.length) {
     const sourcesLower = params.sources.map(s => s.toLowerCase());
     return mockArticles
-      .filter(article =>
-        sourcesLower.some(source =>
-          article.source.toLowerCase().includes(source)
-        )
-      )
+      .filter(article => {
+        const articleSource = article.source.toLowerCase();
+        return sourcesLower.some(source => articleSource.includes(source));
+      })
       .slice(0, params.limit || 10);
   }
 
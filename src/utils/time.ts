@@ -0,0 +1,22 @@
+/**
+ * Timestamp utilities
+ * Memoizes the current ISO timestamp so calls within the same millisecond
+ * share one string instead of allocating and formatting a Date each time
+ */
+
+let cachedMs = -1;
+let cachedIso = '';
+
+/**
+ * Get the current time as an ISO 8601 string (same output as new Date().toISOString())
+ */
+export function nowIso(): string {
+  const now = Date.now();
+
+  if (now !== cachedMs) {
+    cachedMs = now;
+    cachedIso = new Date(now).toISOString();
+  }
+
+  return cachedIso;
+}
@@ -0,0 +1,91 @@
+/**
+ * Tests for JSON-RPC batch handling in the STDIO protocol handler
+ */
+
+import { describe, it, expect, beforeEach, jest } from '@jest/globals';
+import { StdioProtocolHandler } from '../../src/protocols/stdio';
+import { ErrorCodes } from '../../src/types/index';
+import type { Logger } from '../../src/types/index';
+
+const mockLogger: Logger = {
+  trace: jest.fn(),
+  debug: jest.fn(),
+  info: jest.fn(),
+  warn: jest.fn(),
+  error: jest.fn(),
+  child: jest.fn(() => mockLogger),
+};
+
+/**
+ * Feed one raw line to the handler and return the parsed output lines
+ */
+async function sendLine(handler: StdioProtocolHandler, line: string): Promise<unknown[]> {
+  const writeSpy = jest.spyOn(process.stdout, 'write').mockImplementation(() => true);
+
+  await (handler as any).processMessage(line);
+
+  const output = writeSpy.mock.calls.map(call => String(call[0])).join('');
+  writeSpy.mockRestore();
+
+  return output.split('\n').filter(Boolean).map(entry => JSON.parse(entry));
+}
+
+describe('StdioProtocolHandler batch requests', () => {
+  let handler: StdioProtocolHandler;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    handler = new StdioProtocolHandler(mockLogger);
+  });
+
+  it('should reject an empty batch with a single error response', async () => {
+    const output = await sendLine(handler, '[]');
+
+    expect(output).toHaveLength(1);
+    expect(output[0]).toMatchObject({
+      jsonrpc: '2.0',
+      error: { code: ErrorCodes.INVALID_REQUEST, message: 'Empty batch request' },
+    });
+  });
+
+  it('should answer a mixed batch in request order, leaving out notifications', async () => {
+    const output = await sendLine(handler, JSON.stringify([
+      { jsonrpc: '2.0', id: 1, method: 'ping' },
+      { jsonrpc: '2.0', method: 'notifications/initialized' },
+      { jsonrpc: '2.0', id: 'b', method: 'ping' },
+    ]));
+
+    expect(output).toHaveLength(1);
+    const responses = output[0] as Array<Record<string, any>>;
+
+    expect(responses).toHaveLength(2);
+    expect(responses[0]).toMatchObject({ id: 1, result: { pong: true } });
+    expect(responses[1]).toMatchObject({ id: 'b', result: { pong: true } });
+  });
+
+  it('should report invalid entries with a null id', async () => {
+    const output = await sendLine(handler, JSON.stringify([
+      42,
+      { jsonrpc: '2.0', id: 0, method: 'ping' },
+    ]));
+
+    const responses = output[0] as Array<Record<string, any>>;
+
+    expect(responses).toHaveLength(2);
+    expect(responses[0]).toEqual({
+      jsonrpc: '2.0',
+      id: null,
+      error: { code: ErrorCodes.INVALID_REQUEST, message: 'Invalid MCP request format' },
+    });
+    expect(responses[1]).toMatchObject({ id: 0, result: { pong: true } });
+  });
+
+  it('should write nothing for an all-notification batch', async () => {
+    const output = await sendLine(handler, JSON.stringify([
+      { jsonrpc: '2.0', method: 'notifications/initialized' },
+      { jsonrpc: '2.0', method: 'notifications/cancelled' },
+    ]));
+
+    expect(output).toHaveLength(0);
+  });
+});
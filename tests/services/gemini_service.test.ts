@@ -0,0 +1,117 @@
+/**
+ * Tests for Gemini request concurrency limiting
+ */
+
+import { describe, it, expect, beforeEach, jest } from '@jest/globals';
+import { GeminiService } from '../../src/services/gemini_service';
+import type { Logger } from '../../src/types/index';
+
+const mockGenerateContent = jest.fn<(prompt: string) => Promise<unknown>>();
+
+jest.mock('@google/generative-ai', () => ({
+  GoogleGenerativeAI: jest.fn().mockImplementation(() => ({
+    getGenerativeModel: jest.fn(() => ({ generateContent: mockGenerateContent })),
+  })),
+}));
+
+const mockLogger: Logger = {
+  trace: jest.fn(),
+  debug: jest.fn(),
+  info: jest.fn(),
+  warn: jest.fn(),
+  error: jest.fn(),
+  child: jest.fn(() => mockLogger),
+};
+
+const geminiResponse = {
+  response: {
+    text: () => JSON.stringify({
+      impact: 'Positive',
+      confidence_score: 80,
+      summary: 'Positive outlook',
+      affected_coins: ['BTC'],
+      reasoning: 'Test response',
+    }),
+  },
+};
+
+const flushPromises = () => new Promise(resolve => setImmediate(resolve));
+
+describe('GeminiService concurrency limit', () => {
+  let pending: Array<{ prompt: string; resolve: (value: unknown) => void }>;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    pending = [];
+    mockGenerateContent.mockImplementation(prompt =>
+      new Promise(resolve => pending.push({ prompt, resolve }))
+    );
+  });
+
+  const analyze = (service: GeminiService, content: string) =>
+    service.analyzeSentiment({
+      content,
+      source: 'Test',
+      coins: ['BTC'],
+      analysisDepth: 'basic',
+    });
+
+  it('should cap in-flight Gemini calls and hand slots over in FIFO order', async () => {
+    const service = new GeminiService({
+      apiKey: 'test-key',
+      model: 'gemini-test',
+      maxOutputTokens: 100,
+      temperature: 0,
+      maxConcurrency: 2,
+    }, mockLogger);
+
+    const analyses = ['content-A', 'content-B', 'content-C', 'content-D']
+      .map(content => analyze(service, content));
+
+    await flushPromises();
+    expect(mockGenerateContent).toHaveBeenCalledTimes(2);
+    expect(pending.map(call => call.prompt)).toEqual([
+      expect.stringContaining('content-A'),
+      expect.stringContaining('content-B'),
+    ]);
+
+    // Finishing one call admits exactly the oldest waiter
+    pending[1]!.resolve(geminiResponse);
+    await flushPromises();
+    expect(mockGenerateContent).toHaveBeenCalledTimes(3);
+    expect(pending[2]!.prompt).toContain('content-C');
+
+    pending[0]!.resolve(geminiResponse);
+    await flushPromises();
+    expect(mockGenerateContent).toHaveBeenCalledTimes(4);
+    expect(pending[3]!.prompt).toContain('content-D');
+
+    pending[2]!.resolve(geminiResponse);
+    pending[3]!.resolve(geminiResponse);
+
+    const results = await Promise.all(analyses);
+    expect(results.every(result => result.success)).toBe(true);
+  });
+
+  it('should release the slot when a Gemini call fails', async () => {
+    const service = new GeminiService({
+      apiKey: 'test-key',
+      model: 'gemini-test',
+      maxOutputTokens: 100,
+      temperature: 0,
+      maxConcurrency: 1,
+    }, mockLogger);
+
+    mockGenerateContent.mockRejectedValueOnce(new Error('API unavailable'));
+
+    const failed = await analyze(service, 'content-A');
+    expect(failed.success).toBe(false);
+
+    const second = analyze(service, 'content-B');
+    await flushPromises();
+    expect(mockGenerateContent).toHaveBeenCalledTimes(2);
+
+    pending[0]!.resolve(geminiResponse);
+    expect((await second).success).toBe(true);
+  });
+});
@@ -21,7 +21,9 @@ import { OpenAIService } from '../../src/services/openai_service';
 // Mock dependencies
 const mockCache: jest.Mocked<CacheService> = {
   get: jest.fn(),
+  mget: jest.fn(),
   set: jest.fn(),
+  mset: jest.fn(),
   delete: jest.fn(),
   clear: jest.fn(),
   isConnected: jest.fn(),
@@ -182,6 +184,20 @@ describe('AnalyzeCryptoSentimentTool', () => {
       expect(result.summary).toContain('failed');
     });
 
+    it('should reject content that is too long before calling the analyzer', async () => {
+      const invalidParams = {
+        content: 'x'.repeat(10001),
+        source: 'Test',
+        coins: ['BTC'],
+      };
+
+      const result = await tool.execute(invalidParams, mockContext);
+
+      expect(result.impact).toBe('Neutral');
+      expect(result.summary).toContain('failed');
+      expect(mockOpenAIService.analyzeSentiment).not.toHaveBeenCalled();
+    });
+
     it('should reject empty coins array', async () => {
       const invalidParams = {
         content: 'Valid content length for testing',
@@ -337,6 +353,39 @@ describe('AnalyzeCryptoSentimentTool', () => {
       expect(getCalls[0][0]).toBe(getCalls[1][0]);
     });
 
+    it('should share one analysis between concurrent identical requests', async () => {
+      mockCache.get.mockResolvedValue(null);
+      mockOpenAIService.analyzeSentiment.mockResolvedValue({
+        success: true,
+        data: {
+          impact: 'Positive',
+          confidence_score: 70,
+          summary: 'Shared analysis',
+          affected_coins: ['ETH'],
+          reasoning: 'Duplicate request',
+        },
+        metadata: {
+          timestamp: new Date().toISOString(),
+          responseTimeMs: 800,
+        },
+      });
+
+      const [first, second] = await Promise.all([
+        tool.execute(validParams, mockContext),
+        tool.execute(validParams, mockContext),
+      ]);
+
+      expect(first.impact).toBe('Positive');
+      expect(first.summary).toBe('Shared analysis');
+      expect(first).toEqual(second);
+      expect(mockOpenAIService.analyzeSentiment).toHaveBeenCalledTimes(1);
+      expect(mockCache.set).toHaveBeenCalledTimes(1);
+
+      // Once settled, a later identical request runs a fresh analysis
+      await tool.execute(validParams, mockContext);
+      expect(mockOpenAIService.analyzeSentiment).toHaveBeenCalledTimes(2);
+    });
+
     it('should handle cache errors gracefully', async () => {
       mockCache.get.mockRejectedValue(new Error('Cache connection failed'));
       // When cache fails, the tool should return error response
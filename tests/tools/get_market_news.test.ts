@@ -30,7 +30,9 @@ jest.mock('../../src/utils/mockData', () => ({
 
 const mockCache: jest.Mocked<CacheService> = {
   get: jest.fn(),
+  mget: jest.fn(),
   set: jest.fn(),
+  mset: jest.fn(),
   delete: jest.fn(),
   clear: jest.fn(),
   isConnected: jest.fn(),
@@ -69,6 +71,7 @@ describe('GetMarketNewsTool', () => {
   beforeEach(() => {
     jest.clearAllMocks();
     mockCache.isConnected.mockReturnValue(true);
+    mockCache.mget.mockResolvedValue([]);
 
     const { shouldUseMockMode } = require('../../src/config/environment');
     shouldUseMockMode.mockReturnValue(false);
@@ -296,6 +299,44 @@ describe('GetMarketNewsTool', () => {
       expect(getCalls[0][0]).toBe(getCalls[1][0]);
     });
 
+    it('should reuse cached per-source results and write back misses', async () => {
+      const freshArticle = { ...sampleNewsArticle, title: 'Fresh CoinDesk Article' };
+      const fetchSpy = jest.spyOn(tool as any, 'fetchFromSource').mockResolvedValue([freshArticle]);
+
+      mockCache.get.mockResolvedValue(null);
+      // coindesk misses, cointelegraph is served from the per-source cache
+      mockCache.mget.mockResolvedValue([null, [sampleNewsArticle]]);
+
+      const result = await tool.execute(validParams, mockContext);
+
+      expect(mockCache.mget).toHaveBeenCalledWith([
+        expect.stringMatching(/^news:source:[a-z0-9]+$/),
+        expect.stringMatching(/^news:source:[a-z0-9]+$/),
+      ]);
+      expect(fetchSpy).toHaveBeenCalledTimes(1);
+      expect(result.results).toEqual(expect.arrayContaining([sampleNewsArticle, freshArticle]));
+
+      const missedKey = mockCache.mget.mock.calls[0][0][0];
+      expect(missedKey).toMatch(/^news:source:[a-z0-9]+$/);
+      expect(mockCache.mset).toHaveBeenCalledWith([[missedKey, [freshArticle]]], 1800);
+    });
+
+    it('should return fetched results when the per-source write-back fails', async () => {
+      jest.spyOn(tool as any, 'fetchFromSource').mockResolvedValue([sampleNewsArticle]);
+
+      mockCache.get.mockResolvedValue(null);
+      mockCache.mget.mockResolvedValue([null, null]);
+      mockCache.mset.mockRejectedValueOnce(new Error('Cache write failed'));
+
+      const result = await tool.execute(validParams, mockContext);
+
+      expect(result.results).toEqual([sampleNewsArticle]);
+      expect(mockLogger.warn).toHaveBeenCalledWith(
+        'Failed to cache source results',
+        expect.objectContaining({ error: 'Cache write failed' })
+      );
+    });
+
     it('should handle cache errors gracefully', async () => {
       mockCache.get.mockRejectedValue(new Error('Cache connection lost'));
 
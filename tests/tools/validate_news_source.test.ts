@@ -29,7 +29,9 @@ jest.mock('../../src/utils/mockData', () => ({
 
 const mockCache: jest.Mocked<CacheService> = {
   get: jest.fn(),
+  mget: jest.fn(),
   set: jest.fn(),
+  mset: jest.fn(),
   delete: jest.fn(),
   clear: jest.fn(),
   isConnected: jest.fn(),